@@ -1,38 +1,76 @@
 """
 Módulo responsável pela configuração e conexão com o banco de dados SQLite.
-Fornece a engine do SQLAlchemy e as sessões do banco.
+Fornece a engine assíncrona do SQLAlchemy e as sessões do banco.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./todoist.db")
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./todoist.db")
 
-engine = create_engine(
+# Arquivos .env antigos ainda trazem a URL síncrona "sqlite://"; reescreve
+# para o driver aiosqlite exigido pela engine assíncrona
+if DATABASE_URL.startswith("sqlite://"):
+    DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+engine = create_async_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}  # necessário apenas para SQLite
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=25,
+    max_overflow=25,
+    pool_pre_ping=True,
+    pool_recycle=1800,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@event.listens_for(engine.sync_engine, "connect")
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """
+    Aplica PRAGMAs de desempenho do SQLite em cada nova conexão do pool.
+    WAL permite leituras concorrentes com escrita, eliminando a contenção
+    de lock único entre leitores e escritores.
+
+    Args:
+        dbapi_connection: Conexão DBAPI recém-criada
+        connection_record: Registro da conexão no pool
+    """
+    cursor = dbapi_connection.cursor()
+    # SQLite exige habilitar foreign keys por conexão para o ON DELETE CASCADE
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=30000000000")
+    cursor.close()
+
+# expire_on_commit=False evita recargas implícitas (IO) ao acessar objetos
+# após o commit, o que não é permitido fora de await em sessões assíncronas
+SessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
 
 Base = declarative_base()
 
 
-def get_database_session():
+async def get_database_session():
     """
-    Cria e fornece uma sessão do banco de dados.
+    Cria e fornece uma sessão assíncrona do banco de dados.
     A sessão é automaticamente fechada após o uso.
 
     Yields:
-        Session: Sessão do banco de dados SQLAlchemy
+        AsyncSession: Sessão assíncrona do banco de dados SQLAlchemy
     """
     database = SessionLocal()
     try:
         yield database
     finally:
-        database.close()
+        await database.close()
@@ -3,9 +3,8 @@ Modelo de dados para tarefas do sistema.
 Representa a tabela 'tasks' no banco de dados.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from backend.database import Base
 
 
@@ -24,13 +23,21 @@ class Task(Base):
         owner: Relacionamento com o usuário proprietário
     """
     __tablename__ = "tasks"
+    # Índice composto permite resolver as buscas por usuário (e por usuário + id)
+    # direto no índice, sem varredura completa da tabela
+    __table_args__ = (Index("ix_tasks_user_id_id", "user_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     is_completed = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # Timestamps calculados pelo banco (CURRENT_TIMESTAMP), sem construir
+    # datetime em Python a cada INSERT/UPDATE nem trafegá-lo como parâmetro
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
-    owner = relationship("User", back_populates="tasks")
+    # lazy="raise" transforma qualquer acesso acidental a task.owner em erro
+    # explícito em vez de emitir N+1 queries silenciosas; endpoints que
+    # precisarem do dono devem usar .options(selectinload(Task.owner))
+    owner = relationship("User", back_populates="tasks", lazy="raise")
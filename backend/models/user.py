@@ -3,9 +3,8 @@ Modelo de dados para usuários do sistema.
 Representa a tabela 'users' no banco de dados.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from backend.database import Base
 
 
@@ -27,6 +26,14 @@ class User(Base):
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
-    tasks = relationship("Task", back_populates="owner", cascade="all, delete-orphan")
+    # passive_deletes delega a remoção em cascata ao banco (ON DELETE CASCADE):
+    # deletar um usuário vira um único DELETE em vez de carregar e remover
+    # cada tarefa individualmente pela sessão
+    tasks = relationship(
+        "Task",
+        back_populates="owner",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
@@ -3,14 +3,22 @@ Rotas de autenticação da API.
 Gerencia registro e login de usuários.
 """
 
+import anyio.to_thread
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
 from backend.database import get_database_session
 from backend.models import User
 from backend.schemas import UserCreate, UserLogin, UserResponse, Token
-from backend.services import hash_password, verify_password, create_access_token, get_current_user
+from backend.services import (
+    hash_password,
+    verify_password,
+    password_needs_rehash,
+    create_access_token,
+    get_current_user,
+)
 import os
 
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
@@ -19,7 +27,7 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register_user(user: UserCreate, database: Session = Depends(get_database_session)):
+async def register_user(user: UserCreate, database: AsyncSession = Depends(get_database_session)):
     """
     Registra um novo usuário no sistema.
 
@@ -33,41 +41,43 @@ def register_user(user: UserCreate, database: Session = Depends(get_database_ses
     Raises:
         HTTPException: Se o username ou email já existirem
     """
-    existing_user_by_username = database.query(User).filter(
-        User.username == user.username
-    ).first()
-
-    if existing_user_by_username:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
+    # Uma única query cobre as duas verificações de unicidade,
+    # evitando round-trips extras ao banco no caminho de validação
+    # Hash calculado antes de qualquer acesso ao banco: o Argon2id leva
+    # dezenas de milissegundos e não deve estender a janela em que uma
+    # conexão do pool fica ocupada. Roda no threadpool por ser CPU-bound
+    hashed_password = await anyio.to_thread.run_sync(hash_password, user.password)
+
+    result = await database.execute(
+        select(User.username, User.email).where(
+            or_(User.username == user.username, User.email == user.email)
         )
+    )
+    existing_user = result.first()
 
-    existing_user_by_email = database.query(User).filter(
-        User.email == user.email
-    ).first()
-
-    if existing_user_by_email:
+    if existing_user:
+        username_is_taken = existing_user.username == user.username
+        detail = "Username already registered" if username_is_taken else "Email already registered"
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
+            detail=detail
         )
 
     new_user = User(
         username=user.username,
         email=user.email,
-        hashed_password=hash_password(user.password)
+        hashed_password=hashed_password
     )
 
     database.add(new_user)
-    database.commit()
-    database.refresh(new_user)
+    await database.commit()
+    await database.refresh(new_user)
 
     return new_user
 
 
 @router.post("/login", response_model=Token)
-def login_user(user: UserLogin, database: Session = Depends(get_database_session)):
+async def login_user(user: UserLogin, database: AsyncSession = Depends(get_database_session)):
     """
     Autentica um usuário e retorna um token de acesso.
 
@@ -81,18 +91,29 @@ def login_user(user: UserLogin, database: Session = Depends(get_database_session
     Raises:
         HTTPException: Se as credenciais forem inválidas
     """
-    db_user = database.query(User).filter(User.username == user.username).first()
+    result = await database.execute(select(User).where(User.username == user.username))
+    db_user = result.scalar_one_or_none()
+
+    # Verificação de senha é CPU-bound; roda fora do event loop
+    password_is_valid = db_user is not None and await anyio.to_thread.run_sync(
+        verify_password, user.password, db_user.hashed_password
+    )
 
-    if not db_user or not verify_password(user.password, db_user.hashed_password):
+    if not password_is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Migra hashes legados (bcrypt) ou com parâmetros antigos para Argon2id atual
+    if password_needs_rehash(db_user.hashed_password):
+        db_user.hashed_password = await anyio.to_thread.run_sync(hash_password, user.password)
+        await database.commit()
+
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": db_user.username},
+        data={"sub": str(db_user.id)},
         expires_delta=access_token_expires
     )
 
@@ -100,7 +121,7 @@ def login_user(user: UserLogin, database: Session = Depends(get_database_session
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """
     Retorna as informações do usuário autenticado.
 
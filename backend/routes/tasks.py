@@ -3,8 +3,10 @@ Rotas de gerenciamento de tarefas da API.
 Fornece operações CRUD para tarefas dos usuários.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from backend.database import get_database_session
@@ -14,12 +16,25 @@ from backend.services import get_current_user
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
+# Serializa a lista inteira em uma única chamada nativa do pydantic-core,
+# em vez de construir um TaskResponse por item no caminho do FastAPI
+TASK_LIST_ADAPTER: TypeAdapter = TypeAdapter(List[TaskResponse])
+
+# Statements dos caminhos quentes construídos uma única vez no import:
+# a árvore de expressão não é remontada por requisição e o cache de
+# compilação do SQLAlchemy os trata como statements efetivamente preparados
+SELECT_TASKS_FOR_USER = select(Task).where(Task.user_id == bindparam("user_id"))
+SELECT_TASK_BY_ID_FOR_USER = select(Task).where(
+    Task.id == bindparam("task_id"),
+    Task.user_id == bindparam("user_id"),
+)
+
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     task: TaskCreate,
     current_user: User = Depends(get_current_user),
-    database: Session = Depends(get_database_session)
+    database: AsyncSession = Depends(get_database_session)
 ):
     """
     Cria uma nova tarefa para o usuário autenticado.
@@ -39,16 +54,16 @@ def create_task(
     )
 
     database.add(new_task)
-    database.commit()
-    database.refresh(new_task)
+    await database.commit()
+    await database.refresh(new_task)
 
     return new_task
 
 
-@router.get("", response_model=List[TaskResponse])
-def get_all_tasks(
+@router.get("")
+async def get_all_tasks(
     current_user: User = Depends(get_current_user),
-    database: Session = Depends(get_database_session)
+    database: AsyncSession = Depends(get_database_session)
 ):
     """
     Retorna todas as tarefas do usuário autenticado.
@@ -58,17 +73,22 @@ def get_all_tasks(
         database: Sessão do banco de dados
 
     Returns:
-        List[TaskResponse]: Lista de todas as tarefas do usuário
+        Response: Array JSON com as tarefas do usuário
     """
-    tasks = database.query(Task).filter(Task.user_id == current_user.id).all()
-    return tasks
+    result = await database.execute(SELECT_TASKS_FOR_USER, {"user_id": current_user.id})
+    tasks = result.scalars().all()
+
+    validated_tasks = TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
+    task_list_json = TASK_LIST_ADAPTER.dump_json(validated_tasks)
+
+    return Response(content=task_list_json, media_type="application/json")
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task_by_id(
+async def get_task_by_id(
     task_id: int,
     current_user: User = Depends(get_current_user),
-    database: Session = Depends(get_database_session)
+    database: AsyncSession = Depends(get_database_session)
 ):
     """
     Retorna uma tarefa específica pelo ID.
@@ -84,10 +104,10 @@ def get_task_by_id(
     Raises:
         HTTPException: Se a tarefa não existir ou não pertencer ao usuário
     """
-    task = database.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == current_user.id
-    ).first()
+    result = await database.execute(
+        SELECT_TASK_BY_ID_FOR_USER, {"task_id": task_id, "user_id": current_user.id}
+    )
+    task = result.scalar_one_or_none()
 
     if not task:
         raise HTTPException(
@@ -99,11 +119,11 @@ def get_task_by_id(
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
-def update_task(
+async def update_task(
     task_id: int,
     task_update: TaskUpdate,
     current_user: User = Depends(get_current_user),
-    database: Session = Depends(get_database_session)
+    database: AsyncSession = Depends(get_database_session)
 ):
     """
     Atualiza uma tarefa existente.
@@ -121,10 +141,35 @@ def update_task(
     Raises:
         HTTPException: Se a tarefa não existir ou não pertencer ao usuário
     """
-    task = database.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == current_user.id
-    ).first()
+    # Apenas os campos realmente enviados, já validados na entrada
+    update_values = {
+        field: getattr(task_update, field)
+        for field in task_update.__pydantic_fields_set__
+    }
+
+    if not update_values:
+        result = await database.execute(
+            SELECT_TASK_BY_ID_FOR_USER, {"task_id": task_id, "user_id": current_user.id}
+        )
+        task = result.scalar_one_or_none()
+
+        if not task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found"
+            )
+
+        return task
+
+    # UPDATE ... RETURNING valida a posse e aplica a mutação em um único
+    # round-trip, sem carregar a tarefa antes
+    result = await database.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == current_user.id)
+        .values(**update_values)
+        .returning(Task)
+    )
+    task = result.scalar_one_or_none()
 
     if not task:
         raise HTTPException(
@@ -132,22 +177,16 @@ def update_task(
             detail="Task not found"
         )
 
-    update_data = task_update.model_dump(exclude_unset=True)
-
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
-    database.commit()
-    database.refresh(task)
+    await database.commit()
 
     return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     task_id: int,
     current_user: User = Depends(get_current_user),
-    database: Session = Depends(get_database_session)
+    database: AsyncSession = Depends(get_database_session)
 ):
     """
     Deleta uma tarefa existente.
@@ -163,18 +202,17 @@ def delete_task(
     Raises:
         HTTPException: Se a tarefa não existir ou não pertencer ao usuário
     """
-    task = database.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == current_user.id
-    ).first()
+    # DELETE direto valida a posse pelo rowcount, sem SELECT prévio
+    result = await database.execute(
+        delete(Task).where(Task.id == task_id, Task.user_id == current_user.id)
+    )
 
-    if not task:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    database.delete(task)
-    database.commit()
+    await database.commit()
 
     return None
@@ -3,7 +3,7 @@ Schemas Pydantic para validação e serialização de dados de tarefas.
 Define os modelos de entrada e saída da API relacionados a tarefas.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional
 
@@ -38,6 +38,10 @@ class TaskUpdate(BaseModel):
         description: Nova descrição da tarefa
         is_completed: Novo status de conclusão
     """
+    # extra="forbid" garante que fields_set contenha apenas colunas conhecidas,
+    # permitindo aplicá-los direto no modelo ORM sem filtragem adicional
+    model_config = ConfigDict(extra="forbid")
+
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = None
     is_completed: Optional[bool] = None
@@ -5,6 +5,7 @@ Pacote de serviços de negócio da aplicação.
 from .security import (
     hash_password,
     verify_password,
+    password_needs_rehash,
     create_access_token,
     get_current_user,
 )
@@ -12,6 +13,7 @@ from .security import (
 __all__ = [
     "hash_password",
     "verify_password",
+    "password_needs_rehash",
     "create_access_token",
     "get_current_user",
 ]
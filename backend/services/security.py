@@ -5,17 +5,19 @@ Gerencia hashing de senhas, criação e validação de tokens JWT.
 
 from datetime import datetime, timedelta
 from typing import Optional
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from cachetools import TTLCache
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 from dotenv import load_dotenv
 
 from backend.database import get_database_session
 from backend.models import User
-from backend.schemas import TokenData
 
 load_dotenv()
 
@@ -23,13 +25,32 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
-password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Pré-computados no import para evitar recriar a chave HMAC e a lista de
+# algoritmos a cada encode/decode — get_current_user roda em toda requisição
+SECRET_KEY_BYTES = SECRET_KEY.encode()
+JWT_ALGORITHMS = [ALGORITHM]
+
+password_hasher = PasswordHasher(
+    time_cost=2,
+    memory_cost=65536,
+    parallelism=2,
+    hash_len=32,
+    salt_len=16,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Hashes bcrypt legados (gerados antes da migração para Argon2id) começam com "$2"
+LEGACY_BCRYPT_PREFIX = "$2"
+
+# Cache de ids de usuário já extraídos de tokens válidos, chaveado pelo token bruto.
+# TTL curto (60s) bem abaixo da expiração do token mantém a janela de
+# revalidação pequena e evita repetir HMAC + parse JSON a cada requisição
+decoded_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
 
 def hash_password(password: str) -> str:
     """
-    Cria um hash seguro da senha usando bcrypt.
+    Cria um hash seguro da senha usando Argon2id.
 
     Args:
         password: Senha em texto plano
@@ -37,12 +58,13 @@ def hash_password(password: str) -> str:
     Returns:
         str: Hash da senha
     """
-    return password_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifica se a senha em texto plano corresponde ao hash armazenado.
+    Suporta hashes bcrypt legados além do Argon2id atual.
 
     Args:
         plain_password: Senha em texto plano
@@ -51,7 +73,31 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True se a senha está correta, False caso contrário
     """
-    return password_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith(LEGACY_BCRYPT_PREFIX):
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+    try:
+        password_hasher.verify(hashed_password, plain_password)
+        return True
+    except VerifyMismatchError:
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Indica se o hash armazenado deve ser regenerado com os parâmetros atuais.
+    Hashes bcrypt legados e hashes Argon2id com parâmetros antigos retornam True.
+
+    Args:
+        hashed_password: Hash da senha armazenado
+
+    Returns:
+        bool: True se o hash deve ser regenerado
+    """
+    if hashed_password.startswith(LEGACY_BCRYPT_PREFIX):
+        return True
+
+    return password_hasher.check_needs_rehash(hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -73,14 +119,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY_BYTES, algorithm=ALGORITHM)
 
     return encoded_jwt
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    database: Session = Depends(get_database_session)
+    database: AsyncSession = Depends(get_database_session)
 ) -> User:
     """
     Extrai e valida o usuário atual a partir do token JWT.
@@ -101,18 +147,24 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
+    user_id = decoded_token_cache.get(token)
 
-        if username is None:
-            raise credentials_exception
+    if user_id is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY_BYTES, algorithms=JWT_ALGORITHMS)
+            subject = payload.get("sub")
 
-        token_data = TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
+            if subject is None:
+                raise credentials_exception
+
+            user_id = int(subject)
+            decoded_token_cache[token] = user_id
+        except (JWTError, ValueError):
+            raise credentials_exception
 
-    user = database.query(User).filter(User.username == token_data.username).first()
+    # Busca por chave primária aproveita o identity map da sessão e o
+    # caminho mais curto do índice no banco
+    user = await database.get(User, user_id)
 
     if user is None:
         raise credentials_exception
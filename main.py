@@ -3,23 +3,60 @@ Arquivo principal da aplicação FastAPI.
 Configura e inicializa o servidor web, rotas e banco de dados.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import inspect
 import os
 
 from backend.database import Base, engine
 from backend.routes import auth_router, tasks_router
 from backend.models import User, Task
 
-# Cria as tabelas no banco de dados
-Base.metadata.create_all(bind=engine)
+
+def database_tables_exist(sync_connection) -> bool:
+    """
+    Verifica se o schema já foi criado no banco de dados.
+
+    Args:
+        sync_connection: Conexão síncrona fornecida por run_sync
+
+    Returns:
+        bool: True se a tabela de usuários já existe
+    """
+    return inspect(sync_connection).has_table("users")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Gerencia o ciclo de vida da aplicação.
+    Cria as tabelas no banco de dados antes de aceitar requisições,
+    pulando a emissão de DDL quando o schema já existe.
+
+    Args:
+        app: Instância da aplicação FastAPI
+
+    Yields:
+        None: Controle devolvido ao servidor durante a execução
+    """
+    async with engine.begin() as connection:
+        if not await connection.run_sync(database_tables_exist):
+            await connection.run_sync(Base.metadata.create_all)
+    yield
+
 
 app = FastAPI(
     title="Todoist - Task Manager",
     description="API para gerenciamento de tarefas com autenticação de usuários",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializa datetimes nativamente e emite UTF-8 direto em bytes,
+    # acelerando a codificação de toda resposta JSON da API
+    default_response_class=ORJSONResponse
 )
 
 # Configuração de CORS para permitir requisições do frontend